@@ -2,9 +2,51 @@ import fitz
 import re
 import json
 import numpy as np
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
+
+# Header/footer content (page numbers, copyright, URLs, watermarks) fused
+# into a single alternation so each candidate costs one regex match. It is
+# matched against the lowercased text _is_potential_heading already builds,
+# so the pattern is lowercase and needs no IGNORECASE
+_HF_RE = re.compile(
+    r'^(?:\d+$'                     # Just page numbers
+    r'|page\s+\d+'                  # "Page 1", "Page 2"
+    r'|\d+\s*/\s*\d+$'              # "1/5", "2 / 10"
+    r'|©'                           # Copyright
+    r'|copyright'
+    r'|all rights reserved'
+    r'|\w+\.(?:com|org|net)'        # URLs
+    r'|www\.'
+    r'|https?://'
+    r'|(?:draft|confidential|proprietary)$)'  # Watermarks
+)
+
+# Numbered heading prefixes: "1 ", "1.1 ", "1.1.1 "
+_NUM1_RE = re.compile(r'^\d+\.?\s+')
+_NUM2_RE = re.compile(r'^\d+\.\d+\.?\s+')
+_NUM3_RE = re.compile(r'^\d+\.\d+\.\d+\.?\s+')
+
+# Common fragments that should never be headings
+_FRAGMENTS = frozenset({
+    'quest f', 'r pr', 'oposal', 'rfp:', 'request f', 'quest for pr',
+    'r proposal', 'for pr', 'pr', 'quest', 'equest', 'r', 'f', 'quest for',
+    'proposal', 'present', 'developing', 'business', 'plan', 'ontario',
+    'digital', 'library'
+})
+
+_VOWELS = frozenset('aeiou')
+
+# Font weight indicators in font names
+_BOLD_FONT_RE = re.compile(r'bold|black|heavy', re.IGNORECASE)
+_MEDIUM_FONT_RE = re.compile(r'medium|semi', re.IGNORECASE)
+
 @dataclass
 class Heading:
     text: str
@@ -14,6 +56,67 @@ class Heading:
     font_size: float
     font_name: str
     confidence: float
+    font_id: int = -1  # Index into the analyzer's interned font names
+
+@dataclass
+class HeadingTable:
+    """Column-oriented heading candidates: one array per field, font names interned"""
+    texts: List[str]
+    pages: np.ndarray       # (N,) int32
+    bboxes: np.ndarray      # (N, 4) float64, NaN row when a heading has no bbox
+    font_sizes: np.ndarray  # (N,) float64
+    font_ids: np.ndarray    # (N,) int32 index into font_names
+    font_names: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    @classmethod
+    def from_headings(cls, headings: List[Heading], font_names: List[str]) -> "HeadingTable":
+        n = len(headings)
+        return cls(
+            texts=[h.text for h in headings],
+            pages=np.fromiter((h.page for h in headings), dtype=np.int32, count=n),
+            bboxes=np.array([h.bbox if h.bbox else (np.nan,) * 4 for h in headings],
+                            dtype=np.float64).reshape(n, 4),
+            font_sizes=np.fromiter((h.font_size for h in headings), dtype=np.float64, count=n),
+            font_ids=np.fromiter((h.font_id for h in headings), dtype=np.int32, count=n),
+            font_names=font_names
+        )
+    
+    def take(self, order: np.ndarray) -> "HeadingTable":
+        """Rows reordered/selected by index array"""
+        return HeadingTable(
+            texts=[self.texts[i] for i in order],
+            pages=self.pages[order],
+            bboxes=self.bboxes[order],
+            font_sizes=self.font_sizes[order],
+            font_ids=self.font_ids[order],
+            font_names=self.font_names
+        )
+
+def _merge_group_starts(pages: List[int], font_sizes: List[float], font_ids: List[int],
+                        tops: List[float], bottoms: List[float], lengths: List[int]) -> List[int]:
+    """Start index of each merge group; a group ends at the first heading that can't join it"""
+    n = len(pages)
+    starts = []
+    i = 0
+    
+    while i < n:
+        starts.append(i)
+        
+        # Compare following headings against the group's first one
+        j = i + 1
+        while (j < n and
+               pages[j] == pages[i] and                           # Merges never cross pages
+               abs(font_sizes[j] - font_sizes[i]) <= 1.0 and      # Font size within 1 point
+               font_ids[j] == font_ids[i] and                     # Same font name
+               not abs(tops[j] - bottoms[i]) > 30 and             # Vertically within 30 points
+               lengths[j] + lengths[i] + 1 <= 300):               # Reasonable combined length
+            j += 1
+        i = j
+    
+    return starts
 
 class PDFHeadingAnalyzer:
     def __init__(self):
@@ -23,30 +126,22 @@ class PDFHeadingAnalyzer:
         - Merges adjacent text with similar formatting
         - Uses hybrid approach with statistical thresholds
         """
-        pass
+        # Interned font names, shared by all pages of the current document
+        self._font_ids: Dict[str, int] = {}
+        self._font_names: List[str] = []
     
     def analyze_pdf(self, pdf_path: str) -> Dict:
         """Main analysis function with header/footer filtering"""
-        doc = fitz.open(pdf_path)
-        
-        # Extract all potential headings
-        all_headings = []
-        for page_num in range(len(doc)):
-            page_headings = self._extract_page_headings(doc[page_num], page_num + 1)
-            all_headings.extend(page_headings)
-        
-        doc.close()
-        
-        # Merge adjacent headings with similar formatting
-        merged_headings = self._merge_adjacent_headings(all_headings)
-        
-        # Classify headings using ML-inspired model
-        classified = self._classify_headings(merged_headings)
-        
-        return classified
+        with fitz.open(pdf_path) as doc:
+            return self.analyze_pdf_from_doc(doc)
     
     def analyze_pdf_from_doc(self, doc) -> Dict:
         """Analyze PDF from already opened document"""
+        # Fresh intern table per document: the analyzer is reused across files,
+        # and typography is scored for every interned font
+        self._font_ids = {}
+        self._font_names = []
+        
         # Extract all potential headings
         all_headings = []
         for page_num in range(len(doc)):
@@ -54,7 +149,7 @@ class PDFHeadingAnalyzer:
             all_headings.extend(page_headings)
         
         # Merge adjacent headings with similar formatting
-        merged_headings = self._merge_adjacent_headings(all_headings)
+        merged_headings = self._merge_adjacent_headings(HeadingTable.from_headings(all_headings, self._font_names))
         
         # Classify headings using ML-inspired model
         classified = self._classify_headings(merged_headings)
@@ -64,7 +159,9 @@ class PDFHeadingAnalyzer:
     def _extract_page_headings(self, page, page_num: int) -> List[Heading]:
         """Extract potential headings with enhanced header/footer filtering"""
         headings = []
-        blocks = page.get_text("dict")
+        # Text-only flags: same as the "dict" defaults minus image extraction,
+        # which would decode every embedded image just to be skipped below
+        blocks = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
         page_height = page.rect.height
         page_width = page.rect.width
         
@@ -73,26 +170,35 @@ class PDFHeadingAnalyzer:
                 continue
                 
             for line in block["lines"]:
-                line_text = ""
-                font_sizes = []
-                font_names = []
-                bbox = None
-                
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    if text:
-                        line_text += text + " "
-                        font_sizes.append(span.get("size", 0))
-                        font_names.append(span.get("font", ""))
-                        
-                        span_bbox = span.get("bbox", (0, 0, 0, 0))
-                        if bbox is None:
-                            bbox = span_bbox
-                        else:
-                            bbox = (min(bbox[0], span_bbox[0]), min(bbox[1], span_bbox[1]),
-                                   max(bbox[2], span_bbox[2]), max(bbox[3], span_bbox[3]))
+                spans = line.get("spans", [])
                 
-                line_text = line_text.strip()
+                if len(spans) == 1:
+                    # Most lines are a single span: no joining or bbox reduction needed
+                    span = spans[0]
+                    line_text = span.get("text", "").strip()
+                    if not line_text:
+                        continue
+                    font_sizes = [span.get("size", 0)]
+                    font_names = [span.get("font", "")]
+                    font_name = font_names[0]
+                    bbox = span.get("bbox", (0, 0, 0, 0))
+                else:
+                    line_text = ""
+                    font_sizes = []
+                    font_names = []
+                    span_bboxes = []
+                    
+                    for span in spans:
+                        text = span.get("text", "").strip()
+                        if text:
+                            line_text += text + " "
+                            font_sizes.append(span.get("size", 0))
+                            font_names.append(span.get("font", ""))
+                            span_bboxes.append(span.get("bbox", (0, 0, 0, 0)))
+                    
+                    line_text = line_text.strip()
+                    font_name = Counter(font_names).most_common(1)[0][0] if font_names else ""
+                    bbox = self._union_bbox(span_bboxes)
                 
                 if self._is_potential_heading(line_text, font_sizes, font_names, bbox, page_height, page_width):
                     heading = Heading(
@@ -101,16 +207,41 @@ class PDFHeadingAnalyzer:
                         page=page_num,
                         bbox=bbox,
                         font_size=max(font_sizes) if font_sizes else 0,
-                        font_name=max(set(font_names), key=font_names.count) if font_names else "",
-                        confidence=0.0
+                        font_name=font_name,
+                        confidence=0.0,
+                        font_id=self._intern_font(font_name)
                     )
                     headings.append(heading)
         
         return headings
     
+    def _intern_font(self, font_name: str) -> int:
+        """Small integer id for a font name, so later stages compare ints"""
+        font_id = self._font_ids.get(font_name)
+        if font_id is None:
+            font_id = len(self._font_names)
+            self._font_names.append(font_name)
+            self._font_ids[font_name] = font_id
+        return font_id
+    
+    def _union_bbox(self, bboxes: List[Tuple]) -> Optional[Tuple]:
+        """Bounding box enclosing all span boxes of a line"""
+        if not bboxes:
+            return None
+        
+        # Most lines have only a few spans; NumPy setup isn't worth it there
+        if len(bboxes) < 4:
+            x0s, y0s, x1s, y1s = zip(*bboxes)
+            return (min(x0s), min(y0s), max(x1s), max(y1s))
+        
+        arr = np.asarray(bboxes, dtype=np.float64)
+        return (float(arr[:, 0].min()), float(arr[:, 1].min()),
+                float(arr[:, 2].max()), float(arr[:, 3].max()))
+    
     def _is_potential_heading(self, text: str, font_sizes: List[float], 
                             font_names: List[str], bbox: Tuple, page_height: float, page_width: float) -> bool:
         """Enhanced filtering with header/footer detection"""
+        # Cheapest and most selective checks first
         if not text or len(text) < 3:
             return False
         
@@ -118,183 +249,112 @@ class PDFHeadingAnalyzer:
         if len(text) > 200:
             return False
         
-        # Skip obvious fragments and broken words
-        text_lower = text.lower().strip()
-        
-        # Common fragments that should never be headings
-        fragments = [
-            'quest f', 'r pr', 'oposal', 'rfp:', 'request f', 'quest for pr', 
-            'r proposal', 'for pr', 'pr', 'quest', 'equest', 'r', 'f', 'quest for',
-            'proposal', 'present', 'developing', 'business', 'plan', 'ontario',
-            'digital', 'library'
-        ]
-        
-        if text_lower in fragments:
+        # Skip text that starts with lowercase (likely continuation)
+        if text[0].islower():
             return False
         
         # Skip very short text unless it's all caps
-        if len(text) < 5 and not text.isupper():
+        is_upper = text.isupper()
+        if len(text) < 5 and not is_upper:
             return False
         
-        # Skip text that looks like broken words (no vowels in short text)
-        if len(text) < 8 and not any(vowel in text_lower for vowel in 'aeiou') and not text.isupper():
+        # Must have reasonable font size
+        if font_sizes and max(font_sizes) < 8:
             return False
         
-        # Skip text that starts with lowercase (likely continuation)
-        if text[0].islower():
-            return False
+        # Lowercased once, shared with header/footer detection
+        text_lower = text.lower().strip()
         
         # Enhanced header/footer detection
-        if self._is_header_or_footer(text, bbox, page_height, page_width):
+        if self._is_header_or_footer(text_lower, bbox, page_height, page_width):
             return False
         
-        # Must have reasonable font size
-        if font_sizes and max(font_sizes) < 8:
+        # Skip obvious fragments and broken words
+        if text_lower in _FRAGMENTS:
+            return False
+        
+        # Skip text that looks like broken words (no vowels in short text)
+        if len(text) < 8 and not is_upper and _VOWELS.isdisjoint(text_lower):
             return False
         
         return True
     
-    def _is_header_or_footer(self, text: str, bbox: Tuple, page_height: float, page_width: float) -> bool:
+    def _is_header_or_footer(self, text_lower: str, bbox: Tuple, page_height: float, page_width: float) -> bool:
         """Enhanced header/footer detection"""
         if not bbox:
             return False
         
-        # Position-based filtering (top 10% and bottom 10% of page)
-        header_threshold = page_height * 0.1
-        footer_threshold = page_height * 0.9
-        
         y_position = bbox[1]  # Top of text
         
-        if y_position < header_threshold or y_position > footer_threshold:
-            return True
+        # Pattern-based filtering for common header/footer content, only needed
+        # for text in the body region; anything in the top 10% or bottom 10% of
+        # the page is a header/footer by position alone
+        if page_height * 0.1 <= y_position <= page_height * 0.9:
+            return _HF_RE.match(text_lower) is not None
         
-        # Pattern-based filtering for common header/footer content
-        text_lower = text.lower().strip()
-        header_footer_patterns = [
-            r'^\d+$',  # Just page numbers
-            r'^page\s+\d+',  # "Page 1", "Page 2"
-            r'^\d+\s*/\s*\d+$',  # "1/5", "2 / 10"
-            r'^©.*',  # Copyright
-            r'^copyright.*',
-            r'^all rights reserved',
-            r'^\w+\.(com|org|net)',  # URLs
-            r'^www\.',
-            r'^https?://',
-            r'^draft$|^confidential$|^proprietary$',  # Watermarks
-        ]
-        
-        return any(re.match(pattern, text_lower) for pattern in header_footer_patterns)
+        return True
     
-    def _merge_adjacent_headings(self, headings: List[Heading]) -> List[Heading]:
+    def _merge_adjacent_headings(self, headings: HeadingTable) -> HeadingTable:
         """Merge adjacent text with similar formatting into single headings"""
-        if not headings:
+        if not len(headings):
             return headings
         
         # Sort by page and vertical position
-        headings.sort(key=lambda x: (x.page, x.bbox[1] if x.bbox else 0))
+        tops = headings.bboxes[:, 1]
+        headings = headings.take(np.lexsort((np.nan_to_num(tops, nan=0.0), headings.pages)))
         
-        merged = []
-        i = 0
+        # Plain lists: most groups end at the next row, so a scalar loop that
+        # stops there beats any per-group array operation
+        n = len(headings)
+        starts = _merge_group_starts(headings.pages.tolist(), headings.font_sizes.tolist(),
+                                     headings.font_ids.tolist(), headings.bboxes[:, 1].tolist(),
+                                     headings.bboxes[:, 3].tolist(), [len(t) for t in headings.texts])
         
-        while i < len(headings):
-            current = headings[i]
-            merged_text = current.text
-            merged_bbox = current.bbox
-            
-            # Look for adjacent headings to merge
-            j = i + 1
-            while j < len(headings) and self._should_merge(current, headings[j]):
-                next_heading = headings[j]
-                merged_text += " " + next_heading.text
-                
-                # Expand bounding box
-                if merged_bbox and next_heading.bbox:
-                    merged_bbox = (
-                        min(merged_bbox[0], next_heading.bbox[0]),  # left
-                        min(merged_bbox[1], next_heading.bbox[1]),  # top
-                        max(merged_bbox[2], next_heading.bbox[2]),  # right
-                        max(merged_bbox[3], next_heading.bbox[3])   # bottom
-                    )
-                
-                j += 1
-            
-            # Create merged heading
-            merged_heading = Heading(
-                text=merged_text.strip(),
-                level="",
-                page=current.page,
-                bbox=merged_bbox,
-                font_size=current.font_size,
-                font_name=current.font_name,
-                confidence=0.0
-            )
-            
-            merged.append(merged_heading)
-            i = j
+        texts = []
+        bboxes = []
         
+        for i, j in zip(starts, starts[1:] + [n]):
+            texts.append(" ".join(headings.texts[i:j]).strip())
+            
+            # Expand bounding box over the group
+            group_bboxes = headings.bboxes[i:j]
+            if j - i > 1 and not np.isnan(group_bboxes[0, 0]):
+                bboxes.append((np.nanmin(group_bboxes[:, 0]), np.nanmin(group_bboxes[:, 1]),
+                               np.nanmax(group_bboxes[:, 2]), np.nanmax(group_bboxes[:, 3])))
+            else:
+                bboxes.append(group_bboxes[0])
+        
+        # Merged headings keep the formatting of their first line; the first line
+        # is also the topmost, so the result stays sorted by page and position
+        merged = headings.take(np.asarray(starts))
+        merged.texts = texts
+        merged.bboxes = np.array(bboxes, dtype=np.float64).reshape(len(starts), 4)
         return merged
     
-    def _should_merge(self, heading1: Heading, heading2: Heading) -> bool:
-        """Check if two headings should be merged based on proximity and formatting"""
-        # Must be on same page
-        if heading1.page != heading2.page:
-            return False
-        
-        # Check font size similarity (within 1 point)
-        if abs(heading1.font_size - heading2.font_size) > 1.0:
-            return False
-        
-        # Check font name similarity
-        if heading1.font_name != heading2.font_name:
-            return False
-        
-        # Check vertical proximity (within 30 points)
-        if heading1.bbox and heading2.bbox:
-            vertical_distance = abs(heading2.bbox[1] - heading1.bbox[3])
-            if vertical_distance > 30:
-                return False
-        
-        # Check if combined text is reasonable length
-        combined_length = len(heading1.text) + len(heading2.text) + 1
-        if combined_length > 300:
-            return False
-        
-        return True
-    
-    def _classify_headings(self, headings: List[Heading]) -> Dict:
-        """Enhanced classification with merged headings"""
-        if not headings:
+    def _classify_headings(self, headings: HeadingTable) -> Dict:
+        """Enhanced classification with merged headings (already sorted by page and position)"""
+        if not len(headings):
             return {"title": "", "outline": []}
         
-        # Calculate font statistics for normalization
-        font_sizes = [h.font_size for h in headings]
-        mean_size = np.mean(font_sizes)
-        std_size = np.std(font_sizes) if len(font_sizes) > 1 else 1
-        
-        # Sort headings by page and position
-        headings.sort(key=lambda x: (x.page, x.bbox[1] if x.bbox else 0))
-        
         title = ""
         outline = []
         
         # Title detection: largest font on first page
-        page1_headings = [h for h in headings if h.page == 1]
-        if page1_headings:
-            title_candidate = max(page1_headings, key=lambda x: x.font_size)
-            title = title_candidate.text
-        
-        # Classify remaining headings
-        for heading in headings:
-            if heading.text == title:
-                continue
-            
-            level, confidence = self._calculate_heading_level(heading, mean_size, std_size)
-            
-            if level and confidence > 0.3:
+        page1 = np.flatnonzero(headings.pages == 1)
+        if page1.size:
+            title = headings.texts[page1[np.argmax(headings.font_sizes[page1])]]
+        
+        levels, confidences = self._calculate_heading_levels(headings)
+        
+        # Classify remaining headings; repeats of the title text are dropped too,
+        # so this compares text rather than skipping the title's row only
+        for text, page, level, confidence in zip(headings.texts, headings.pages.tolist(),
+                                                 levels.tolist(), confidences.tolist()):
+            if level and confidence > 0.3 and text != title:
                 outline.append({
                     "level": level,
-                    "text": heading.text,
-                    "page": heading.page
+                    "text": text,
+                    "page": page
                 })
         
         # Sort outline by page number
@@ -302,44 +362,57 @@ class PDFHeadingAnalyzer:
         
         return {"title": title, "outline": outline}
     
-    def _calculate_heading_level(self, heading: Heading, mean_size: float, std_size: float) -> Tuple[str, float]:
-        """Multi-factor scoring with enhanced pattern recognition"""
+    def _calculate_heading_levels(self, headings: HeadingTable) -> Tuple[np.ndarray, np.ndarray]:
+        """Multi-factor scoring with enhanced pattern recognition, vectorized over all headings"""
+        n = len(headings)
+        
         # Feature 1: Font size score (normalized)
-        font_score = (heading.font_size - mean_size) / (std_size + 1e-6)
+        sizes = headings.font_sizes
+        std_size = sizes.std() if n > 1 else 1
+        font_score = (sizes - sizes.mean()) / (std_size + 1e-6)
         
         # Feature 2: Text pattern score
-        pattern_score = self._analyze_text_patterns(heading.text)
+        pattern_score = np.fromiter((self._analyze_text_patterns(t) for t in headings.texts),
+                                    dtype=np.float64, count=n)
         
-        # Feature 3: Typography score
-        format_score = self._analyze_typography(heading.font_name)
+        # Feature 3: Typography score, computed once per distinct font
+        font_scores = np.array([self._analyze_typography(f) for f in headings.font_names],
+                               dtype=np.float64)
+        format_score = font_scores[headings.font_ids]
         
         # Feature 4: Position score
-        position_score = self._analyze_position(heading.bbox, heading.page)
+        position_score = self._analyze_position(headings.bboxes, headings.pages)
         
         # Weighted combination
         total_score = (0.4 * font_score + 0.3 * pattern_score + 
                       0.2 * format_score + 0.1 * position_score)
         
         # Classification thresholds
-        if total_score > 1.5 or font_score > 2.0:
-            return "H1", min(0.95, 0.7 + total_score * 0.1)
-        elif total_score > 0.8 or font_score > 1.0:
-            return "H2", min(0.9, 0.6 + total_score * 0.1)
-        elif total_score > 0.3 or font_score > 0.5:
-            return "H3", min(0.85, 0.5 + total_score * 0.1)
-        else:
-            return "", 0.0
+        is_h1 = (total_score > 1.5) | (font_score > 2.0)
+        is_h2 = ~is_h1 & ((total_score > 0.8) | (font_score > 1.0))
+        is_h3 = ~is_h1 & ~is_h2 & ((total_score > 0.3) | (font_score > 0.5))
+        
+        levels = np.select([is_h1, is_h2, is_h3], ["H1", "H2", "H3"], default="")
+        confidences = np.select(
+            [is_h1, is_h2, is_h3],
+            [np.minimum(0.95, 0.7 + total_score * 0.1),
+             np.minimum(0.9, 0.6 + total_score * 0.1),
+             np.minimum(0.85, 0.5 + total_score * 0.1)],
+            default=0.0
+        )
+        
+        return levels, confidences
     
     def _analyze_text_patterns(self, text: str) -> float:
         """Enhanced text pattern analysis"""
         score = 0.0
         
         # Numbered headings
-        if re.match(r'^\d+\.?\s+', text):
+        if _NUM1_RE.match(text):
             score += 1.0
-        elif re.match(r'^\d+\.\d+\.?\s+', text):
+        elif _NUM2_RE.match(text):
             score += 0.8
-        elif re.match(r'^\d+\.\d+\.\d+\.?\s+', text):
+        elif _NUM3_RE.match(text):
             score += 0.6
         
         # Title case
@@ -368,38 +441,34 @@ class PDFHeadingAnalyzer:
         if not font_name:
             return 0.0
         
-        font_lower = font_name.lower()
-        
         # Bold indicators
-        if any(weight in font_lower for weight in ['bold', 'black', 'heavy']):
+        if _BOLD_FONT_RE.search(font_name):
             return 1.0
-        elif any(weight in font_lower for weight in ['medium', 'semi']):
+        elif _MEDIUM_FONT_RE.search(font_name):
             return 0.5
         
         return 0.0
     
-    def _analyze_position(self, bbox: Tuple, page: int) -> float:
+    def _analyze_position(self, bboxes: np.ndarray, pages: np.ndarray) -> np.ndarray:
         """Position analysis for heading likelihood"""
-        if not bbox:
-            return 0.0
-        
-        score = 0.0
+        tops = bboxes[:, 1]
         
         # Top of page bonus (but not in header region)
-        if 100 < bbox[1] < 250:  # Sweet spot below header
-            score += 0.5
+        score = np.where((100 < tops) & (tops < 250), 0.5, 0.0)  # Sweet spot below header
         
         # First page bonus
-        if page == 1:
-            score += 0.3
+        score = score + np.where(pages == 1, 0.3, 0.0)
         
-        return score
+        # No position information, no score
+        return np.where(np.isnan(tops), 0.0, score)
 
 def analyze_pdf_headings(pdf_path: str) -> str:
     analyzer = PDFHeadingAnalyzer()
     
     try:
         results = analyzer.analyze_pdf(pdf_path)
+        if orjson is not None:
+            return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(results, indent=2, ensure_ascii=False)
     
     except Exception as e:
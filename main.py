@@ -1,20 +1,114 @@
 import fitz
+import heapq
 import re
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import json
 import logging
 import time
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_PAGE_NUMBER_RE = re.compile(r'^page\s+\d+')
+
+# Text cleanup in a single pass. Alternatives are ordered so the result
+# matches applying them one after another:
+#   leading/trailing non-word chars -> removed
+#   whitespace runs, camelCase boundaries -> single space
+#   4+ repeated chars -> one char
+_CLEAN_RE = re.compile(
+    r'\A[^\w\s]+'
+    r'|[^\w\s]+\Z'
+    r'|(?P<space>\s+|(?<=[a-z])(?=[A-Z]))'
+    r'|(?P<char>.)(?P=char){3,}'
+)
+
+def _trigrams(text: str) -> set:
+    """All 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _clean_replacement(match: re.Match) -> str:
+    """Replacement callback for _CLEAN_RE"""
+    if match.group('space') is not None:
+        return ' '
+    return match.group('char') or ''
+
+# First words that mark a line as running text rather than a heading
+_SENTENCE_STARTERS = frozenset({
+    'the', 'this', 'it', 'in', 'on', 'at', 'for', 'and', 'or', 'but',
+    'with', 'by', 'from', 'to', 'of', 'a', 'an'
+})
+
+# Common paragraph words
+_PARAGRAPH_WORDS = (' will ', ' the ', ' and ', ' that ')
+
+# Common noise: literal prefixes (checked on lowercased text) and the
+# remaining patterns fused into one regex
+_NOISE_PREFIXES = (
+    'continued',            # Continuation text
+    'www.',                 # URLs
+    'http://', 'https://',  # URLs
+)
+_NOISE_RE = re.compile(
+    r'^(?:\d+|[A-Z]|[^\w\s]+)$'    # Just numbers, single letters, only punctuation
+    r'|^(?:page\s+\d'              # Page numbers
+    r'|see\s'                      # References
+    r'|figure\s'                   # Figure references
+    r'|table\s)',                  # Table references
+    re.IGNORECASE
+)
+
+# Fragment detection - common broken words from title fragmentation
+_TITLE_FRAGMENTS = frozenset({
+    'quest f', 'r pr', 'oposal', 'rfp:', 'request f', 'quest for pr',
+    'r proposal', 'for pr', 'pr', 'quest', 'equest'
+})
+
+# Built-in TOC level -> outline level
+_TOC_LEVELS = {1: "H1", 2: "H2", 3: "H3"}
+
+# Title repair substitutions, applied in order
+_TITLE_SUBS = [(re.compile(p), repl) for p, repl in [
+    # Remove repeated patterns like "RFP: R RFP: R"
+    (r'(RFP:\s*R\s*)+', 'RFP:'),
+    # Remove repeated "quest f" patterns and fix to "Request for"
+    (r'(quest\s*f\s*)+', 'quest for '),
+    (r'R\s*quest\s*for?', 'Request for'),
+    (r'equest', 'Request'),  # Fix "equest" to "Request"
+    # Fix broken "Proposal" patterns
+    (r'Pr\s*oposal', 'Proposal'),
+    (r'oposal', 'Proposal'),
+    (r'(\s*r\s*Pr\s*)+', ' '),
+    # Remove repeated RFP patterns
+    (r'RFP:\s*RFP:', 'RFP:'),
+    # Clean up multiple spaces
+    (r'\s+', ' '),
+]]
+
+# Fallback fixes for common broken title patterns
+_TITLE_FALLBACK_SUBS = [(re.compile(p), repl) for p, repl in [
+    (r'Request\s+for\s+o\s*$', 'Request for Proposal'),
+    (r'RFP:\s*Request\s+for\s+oposal.*', 'RFP:Request for Proposal'),
+    (r'quest\s+for\s+Proposal.*', 'Request for Proposal'),
+]]
+
 class PDFOutlineExtractor:
+    # Shared helper.PDFHeadingAnalyzer, see _extract_from_text
+    _analyzer = None
+    
     def __init__(self):
         # Precise heading patterns based on expected outputs
-        self.h1_patterns = [
+        self.h1_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'^(Chapter|CHAPTER)\s+\d+',
             r'^(Appendix|APPENDIX)\s*[A-Z]?:?\s*',
             r'^\d+\.\s+[A-Z].*',  # "1. Introduction..."
@@ -24,49 +118,52 @@ class PDFOutlineExtractor:
             r'^[A-Z][A-Z\s]{10,}$',  # Long ALL CAPS
             r'^PATHWAY\s+OPTIONS$',
             r'^HOPE\s+To\s+SEE\s+You\s+THERE!$'
-        ]
+        ]]
         
-        self.h2_patterns = [
+        self.h2_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'^\d+\.\d+\s+[A-Z].*',  # "2.1 Intended..."
-        ]
+        ]]
         
-        self.h3_patterns = [
+        self.h3_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'^\d+\.\d+\.\d+\s+[A-Z].*',  # "2.1.1 Something"
             r'^[A-Z][a-z\s]+:\s*$',  # "Timeline: "
-        ]
+        ]]
+        
+        # All levels fused into one alternation; alternatives are tried in
+        # order, so H1 patterns still win over H2 and H2 over H3
+        self.heading_re = re.compile('|'.join(
+            f"(?P<{level}>{'|'.join(p.pattern for p in patterns)})"
+            for level, patterns in (("H1", self.h1_patterns),
+                                    ("H2", self.h2_patterns),
+                                    ("H3", self.h3_patterns))
+        ), re.IGNORECASE)
         
         # Form detection keywords
         self.form_keywords = [
             'application form', 'grant of ltc', 'government servant',
             'designation', 'service book', 'signature'
         ]
+        self.form_keyword_re = re.compile('|'.join(map(re.escape, self.form_keywords)))
     
     def extract_outline(self, pdf_path: str) -> Dict:
         """Main extraction method"""
         try:
-            doc = fitz.open(pdf_path)
-            
-            # Check if it's a form document
-            if self._is_form_document(doc):
-                title = self._extract_title_carefully(doc)
-                doc.close()
-                return {"title": title, "outline": []}
-            
-            # Try built-in TOC first
-            toc = doc.get_toc()
-            if toc and len(toc) > 2:  # Only use if substantial TOC
-                outline = self._process_toc(toc)
-                title = self._extract_title_carefully(doc)
-                doc.close()
-                return {"title": title, "outline": outline}
-            
-            # Extract from text analysis
-            outline = self._extract_from_text(doc)
-            title = self._extract_title_carefully(doc)
-            
-            doc.close()
-            return {"title": title, "outline": outline}
-            
+            with fitz.open(pdf_path) as doc:
+                # Forms get an empty outline; otherwise prefer a substantial
+                # built-in TOC and fall back to text analysis
+                if self._is_form_document(doc):
+                    outline = []
+                else:
+                    toc = doc.get_toc()
+                    if toc and len(toc) > 2:
+                        outline = self._process_toc(toc)
+                    else:
+                        outline = self._extract_from_text(doc)
+
+                result = {"title": self._extract_title_carefully(doc), "outline": outline}
+
+            return result
+
         except Exception as e:
             logger.error(f"Error processing {pdf_path}: {e}")
             return {"title": "Error", "outline": []}
@@ -76,19 +173,24 @@ class PDFOutlineExtractor:
         if len(doc) > 5:  # Forms are usually short
             return False
             
-        # Get text from first few pages
+        # Get text from first few pages, stopping as soon as the
+        # indicators that only grow with more text are conclusive
         text = ""
+        form_score = 0
         for page_num in range(min(3, len(doc))):
-            text += doc[page_num].get_text().lower()
-        
-        # Count form indicators
-        form_score = sum(1 for keyword in self.form_keywords if keyword in text)
+            text += doc[page_num].get_text("text").lower()
+            
+            # Count form indicators in one pass over the text
+            form_score = len(set(self.form_keyword_re.findall(text)))
+            if 'ltc' in text and 'advance' in text:
+                form_score += 2
+            
+            if form_score >= 3:
+                return True
         
         # Additional indicators
         if len(text) < 800:  # Very short
             form_score += 1
-        if 'ltc' in text and 'advance' in text:
-            form_score += 2
             
         return form_score >= 3
     
@@ -98,9 +200,9 @@ class PDFOutlineExtractor:
             return ""
         
         page = doc[0]
-        blocks = page.get_text("dict")["blocks"]
+        # Text-only extraction: images are never needed for the title
+        blocks = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]
         
-        candidates = []
         max_font = 0
         
         # Find max font size
@@ -121,33 +223,34 @@ class PDFOutlineExtractor:
                     seen_positions = set()
                     
                     for span in line["spans"]:
-                        pos_key = (round(span["bbox"][0]), round(span["bbox"][1]))
+                        # Pack the rounded (x, y) into one int; page coordinates
+                        # stay far below the 1e6 needed for two keys to collide
+                        bbox = span["bbox"]
+                        pos_key = round(bbox[0]) * 1_000_000 + round(bbox[1])
                         if pos_key not in seen_positions:
                             unique_spans.append(span)
                             seen_positions.add(pos_key)
                     
                     # Build text from unique spans
-                    line_text = ""
                     line_font_size = 0
                     line_is_bold = False
-                    line_bbox = None
+                    line_bbox = unique_spans[0]["bbox"] if unique_spans else None
                     
                     for span in unique_spans:
-                        line_text += span["text"]
-                        line_font_size = max(line_font_size, span["size"])
+                        size = span["size"]
+                        if size > line_font_size:
+                            line_font_size = size
                         if span["flags"] & 16:  # Bold
                             line_is_bold = True
-                        if line_bbox is None:
-                            line_bbox = span["bbox"]
                     
-                    line_text = self._clean_text(line_text)
+                    line_text = self._clean_text("".join([span["text"] for span in unique_spans]))
                     
                     # Add as text element if substantial
                     if (line_text and 
                         len(line_text) > 2 and 
                         line_font_size >= max_font * 0.6 and
                         not line_text.isdigit() and
-                        not re.match(r'^page\s+\d+', line_text.lower())):
+                        not _PAGE_NUMBER_RE.match(line_text.lower())):
                         
                         text_elements.append({
                             'text': line_text,
@@ -160,80 +263,69 @@ class PDFOutlineExtractor:
         if not text_elements:
             return ""
         
-        # Sort by font size and position (top to bottom, left to right)
-        text_elements.sort(key=lambda x: (-x['font_size'], -x['y_pos'], x['x_pos']))
-        
         # Try to build multi-line title from top elements with similar font sizes
-        if text_elements:
-            top_font = text_elements[0]['font_size']
-            title_parts = []
+        top_font = max(elem['font_size'] for elem in text_elements)
+        
+        # Check top 10 elements by font size and position (top to bottom, left to right).
+        # Only elements near the top font size can qualify, so rank just those.
+        near_top_font = [elem for elem in text_elements if elem['font_size'] >= top_font * 0.9]
+        top_elements = heapq.nsmallest(10, near_top_font,
+                                       key=lambda x: (-x['font_size'], -x['y_pos'], x['x_pos']))
+        
+        # Collect elements with similar font size from the top, but sort them by position
+        similar_font_elements = [elem for elem in top_elements if elem['font_size'] >= max_font * 0.7]
+        
+        # Sort similar font elements by reading order (top to bottom, left to right)
+        similar_font_elements.sort(key=lambda x: (x['y_pos'], x['x_pos']))
+        
+        # Collect title parts
+        title_parts = [elem['text'] for elem in similar_font_elements]
+        
+        # Try different combinations
+        if title_parts:
+            # First try: join all parts
+            full_title = ' '.join(title_parts).strip()
             
-            # Collect elements with similar font size from the top, but sort them by position
-            similar_font_elements = []
-            for elem in text_elements[:10]:  # Check top 10 elements
-                if (elem['font_size'] >= top_font * 0.9 and 
-                    elem['font_size'] >= max_font * 0.7):
-                    similar_font_elements.append(elem)
+            # Clean up the extracted title
+            cleaned_title = self._cleanup_extracted_title(full_title)
             
-            # Sort similar font elements by reading order (top to bottom, left to right)
-            similar_font_elements.sort(key=lambda x: (x['y_pos'], x['x_pos']))
+            # Special handling for RFP titles
+            if "RFP:" in cleaned_title and len(cleaned_title) > 50:
+                return cleaned_title
             
-            # Collect title parts
-            for elem in similar_font_elements:
-                title_parts.append(elem['text'])
+            # Try first few parts if full title is too long
+            for i in range(1, min(len(title_parts) + 1, 6)):
+                partial_title = ' '.join(title_parts[:i]).strip()
+                cleaned_partial = self._cleanup_extracted_title(partial_title)
+                if ("RFP:" in cleaned_partial and "Proposal" in cleaned_partial and 
+                    len(cleaned_partial) > 30):
+                    return cleaned_partial
             
-            # Try different combinations
-            if title_parts:
-                # First try: join all parts
-                full_title = ' '.join(title_parts).strip()
-                
-                # Clean up the extracted title
-                cleaned_title = self._cleanup_extracted_title(full_title)
-                
-                # Special handling for RFP titles
-                if "RFP:" in cleaned_title and len(cleaned_title) > 50:
-                    return cleaned_title
-                
-                # Try first few parts if full title is too long
-                for i in range(1, min(len(title_parts) + 1, 6)):
-                    partial_title = ' '.join(title_parts[:i]).strip()
-                    cleaned_partial = self._cleanup_extracted_title(partial_title)
-                    if ("RFP:" in cleaned_partial and "Proposal" in cleaned_partial and 
-                        len(cleaned_partial) > 30):
-                        return cleaned_partial
-                
-                # Return the longest meaningful part
-                if len(cleaned_title) > 15:
-                    return cleaned_title
-                
-                return self._cleanup_extracted_title(title_parts[0]) if title_parts else ""
+            # Return the longest meaningful part
+            if len(cleaned_title) > 15:
+                return cleaned_title
+            
+            return self._cleanup_extracted_title(title_parts[0])
         
         return ""
     
-    def _clean_text(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_text(text: str) -> str:
         """Clean extracted text from common PDF artifacts"""
         if not text:
             return ""
         
-        # Remove repeated characters that are artifacts
-        text = re.sub(r'(.)\1{3,}', r'\1', text)  # Remove 4+ repeated chars
-        
-        # Fix common spacing issues
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Add space between camelCase
-        
-        # Remove obvious garbage
-        text = re.sub(r'^[^\w\s]*', '', text)  # Leading non-word chars
-        text = re.sub(r'[^\w\s]*$', '', text)  # Trailing non-word chars
-        
-        return text.strip()
+        return _CLEAN_RE.sub(_clean_replacement, text).strip()
     
     def _extract_from_text(self, doc) -> List[Dict]:
         """Extract headings using enhanced detection from helper.py"""
-        from helper import PDFHeadingAnalyzer
-        
-        # Use helper's analyzer for heading detection
-        analyzer = PDFHeadingAnalyzer()
+        # Use helper's analyzer for heading detection, created once and
+        # shared by every extractor in this process
+        if PDFOutlineExtractor._analyzer is None:
+            from helper import PDFHeadingAnalyzer
+            PDFOutlineExtractor._analyzer = PDFHeadingAnalyzer()
+        analyzer = PDFOutlineExtractor._analyzer
         
         try:
             # Get the analysis results using the correct method name
@@ -262,46 +354,27 @@ class PDFOutlineExtractor:
         
         for page_num in range(len(doc)):
             page = doc[page_num]
-            blocks = page.get_text("dict")["blocks"]
-            
-            for block in blocks:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        text = ""
-                        for span in line["spans"]:
-                            text += span["text"]
-                        
-                        text = text.strip()
-                        
-                        if text.lower() in seen or len(text) < 3:
-                            continue
-                        
-                        # Only pattern matching
-                        level = None
-                        for pattern in self.h1_patterns:
-                            if re.match(pattern, text, re.IGNORECASE):
-                                level = "H1"
-                                break
-                        
-                        if not level:
-                            for pattern in self.h2_patterns:
-                                if re.match(pattern, text, re.IGNORECASE):
-                                    level = "H2"
-                                    break
-                        
-                        if not level:
-                            for pattern in self.h3_patterns:
-                                if re.match(pattern, text, re.IGNORECASE):
-                                    level = "H3"
-                                    break
-                        
-                        if level:
-                            headings.append({
-                                "level": level,
-                                "text": text,
-                                "page": page_num + 1
-                            })
-                            seen.add(text.lower())
+            # Only line text is needed here, so skip building the span dicts
+            for *_, block_text, _, block_type in page.get_text("blocks"):
+                if block_type != 0:
+                    continue
+                for line in block_text.split("\n"):
+                    text = line.strip()
+
+                    if text.lower() in seen or len(text) < 3:
+                        continue
+
+                    # Only pattern matching
+                    match = self.heading_re.match(text)
+                    level = match.lastgroup if match else None
+
+                    if level:
+                        headings.append({
+                            "level": level,
+                            "text": text,
+                            "page": page_num + 1
+                        })
+                        seen.add(text.lower())
         
         return headings
 
@@ -311,27 +384,21 @@ class PDFOutlineExtractor:
         """Determine heading level based on font size hierarchy and formatting"""
         
         # First check specific patterns - ONLY these should be headings
-        for pattern in self.h1_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return "H1"
-        
-        for pattern in self.h2_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return "H2"
-        
-        for pattern in self.h3_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return "H3"
+        match = self.heading_re.match(text)
+        if match:
+            return match.lastgroup
         
         # VERY strict additional criteria - must meet ALL conditions
         # Skip if it looks like regular text
+        lowered = text.lower()
+        first_word, space, _ = lowered.partition(' ')
         if (len(text) > 80 or  # Too long for a heading
             len(text) < 4 or   # Too short
-            text.lower().startswith(('the ', 'this ', 'it ', 'in ', 'on ', 'at ', 'for ', 'and ', 'or ', 'but ', 'with ', 'by ', 'from ', 'to ', 'of ', 'a ', 'an ')) or  # Sentence starters
+            (space and first_word in _SENTENCE_STARTERS) or  # Sentence starters
             not text[0].isupper() or  # Must start with capital
             text.count('.') > 1 or    # Multiple periods = paragraph
             text.count(',') > 2 or    # Too many commas = paragraph
-            ' will ' in text.lower() or ' the ' in text.lower() or ' and ' in text.lower() or ' that ' in text.lower()):  # Common paragraph words
+            any(word in lowered for word in _PARAGRAPH_WORDS)):  # Common paragraph words
             return None
         
         # Only classify as heading if font is SIGNIFICANTLY larger AND has special formatting
@@ -349,7 +416,9 @@ class PDFOutlineExtractor:
         if not headings:
             return headings
         
-        cleaned = []
+        cleaned = {}  # Lowercased text -> heading, in insertion order
+        rank = {}  # Lowercased text -> insertion position
+        trigram_index = defaultdict(set)  # Trigram -> lowercased texts in cleaned
         seen_texts = set()
         
         # Sort by page and position for better processing
@@ -367,59 +436,51 @@ class PDFOutlineExtractor:
             if self._is_noise_or_fragment(text):
                 continue
             
+            # Kept headings that contain this one, or are contained in it, share
+            # at least one trigram with it; only those need a substring check
+            trigrams = _trigrams(text_lower)
+            candidates = set().union(*(trigram_index[t] for t in trigrams if t in trigram_index))
+            related = [existing_text for existing_text in candidates
+                       if existing_text in cleaned and existing_text != text_lower and
+                       (text_lower in existing_text or existing_text in text_lower)]
+            
             # Skip if it's a substring of an already added heading
-            is_substring = False
-            for existing in cleaned:
-                existing_text = existing["text"].lower()
-                if (text_lower in existing_text or existing_text in text_lower) and text_lower != existing_text:
-                    # Keep the longer, more complete version
-                    if len(text) > len(existing["text"]):
-                        # Remove the shorter version and add the longer one
-                        cleaned = [h for h in cleaned if h["text"].lower() != existing_text]
-                        break
-                    else:
-                        # Skip this shorter version
-                        is_substring = True
-                        break
+            if related:
+                # Earliest added related heading decides
+                existing_text = min(related, key=rank.__getitem__)
+                
+                # Keep the longer, more complete version
+                if len(text) <= len(cleaned[existing_text]["text"]):
+                    # Skip this shorter version
+                    continue
+                
+                # Remove the shorter version and add the longer one
+                del cleaned[existing_text]
             
-            if not is_substring:
-                cleaned.append(heading)
-                seen_texts.add(text_lower)
-        
-        return cleaned
+            # Same as text_lower unless the stored text has surrounding whitespace
+            key = text_lower if text is heading["text"] else heading["text"].lower()
+            cleaned[key] = heading
+            rank[key] = len(rank)
+            for t in _trigrams(key):
+                trigram_index[t].add(key)
+            seen_texts.add(text_lower)
+        
+        return list(cleaned.values())
 
-    def _is_noise_or_fragment(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_noise_or_fragment(text: str) -> bool:
         """Enhanced noise detection for fragments and garbage"""
-        if not text or len(text.strip()) < 3:
+        text = text.strip() if text else ""
+        if len(text) < 3:
             return True
         
-        text = text.strip()
-        
-        # Common noise patterns
-        noise_patterns = [
-            r'^\d+$',           # Just numbers
-            r'^[A-Z]$',         # Single letters
-            r'^page\s+\d+',     # Page numbers
-            r'^see\s+',         # References
-            r'^figure\s+',      # Figure references
-            r'^table\s+',       # Table references
-            r'^continued',      # Continuation text
-            r'^[^\w\s]+$',      # Only punctuation
-            r'^www\.',          # URLs
-            r'^https?://',      # URLs
-        ]
+        text_lower = text.lower()
         
-        for pattern in noise_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
-        
-        # Fragment detection - common broken words from title fragmentation
-        fragments = [
-            'quest f', 'r pr', 'oposal', 'rfp:', 'request f', 'quest for pr', 
-            'r proposal', 'for pr', 'pr', 'quest', 'equest'
-        ]
+        if text_lower.startswith(_NOISE_PREFIXES) or _NOISE_RE.match(text):
+            return True
         
-        if text.lower() in fragments:
+        if text_lower in _TITLE_FRAGMENTS:
             return True
         
         # Very short fragments that are likely broken
@@ -427,7 +488,7 @@ class PDFOutlineExtractor:
             return True
         
         # Text that looks like broken words (no vowels, too many consonants)
-        if len(text) < 8 and not any(vowel in text.lower() for vowel in 'aeiou'):
+        if len(text) < 8 and not any(vowel in text_lower for vowel in 'aeiou'):
             return True
         
         return False
@@ -437,28 +498,21 @@ class PDFOutlineExtractor:
         outline = []
         
         for level, title, page in toc:
-            if not title or len(title.strip()) < 3:
+            text = title.strip() if title else ""
+            if len(text) < 3:
                 continue
             
-            # Map levels
-            if level == 1:
-                heading_level = "H1"
-            elif level == 2:
-                heading_level = "H2"
-            elif level == 3:
-                heading_level = "H3"
-            else:
-                heading_level = "H3"
-            
             outline.append({
-                "level": heading_level,
-                "text": title.strip(),
+                "level": _TOC_LEVELS.get(level, "H3"),  # Deeper levels map to H3
+                "text": text,
                 "page": max(1, page)
             })
         
         return outline
 
-    def _cleanup_extracted_title(self, title: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _cleanup_extracted_title(title: str) -> str:
         """Clean up extracted title from PDF artifacts and duplications"""
         if not title:
             return ""
@@ -466,53 +520,25 @@ class PDFOutlineExtractor:
         # Store original for analysis
         original = title
         
-        # Remove repeated patterns like "RFP: R RFP: R"
-        title = re.sub(r'(RFP:\s*R\s*)+', 'RFP:', title)
-        
-        # Remove repeated "quest f" patterns and fix to "Request for"
-        title = re.sub(r'(quest\s*f\s*)+', 'quest for ', title)
-        title = re.sub(r'R\s*quest\s*for?', 'Request for', title)
-        title = re.sub(r'equest', 'Request', title)  # Fix "equest" to "Request"
-        
-        # Fix broken "Proposal" patterns
-        title = re.sub(r'Pr\s*oposal', 'Proposal', title)
-        title = re.sub(r'oposal', 'Proposal', title)
-        title = re.sub(r'(\s*r\s*Pr\s*)+', ' ', title)
-        
-        # Remove repeated RFP patterns
-        title = re.sub(r'RFP:\s*RFP:', 'RFP:', title)
-        
-        # Clean up multiple spaces
-        title = re.sub(r'\s+', ' ', title)
-        
-        # Advanced reconstruction for RFP titles
-        if "RFP:" in title and ("quest" in title or "Request" in title):
-            # Check if we have key components in either cleaned or original text
-            combined_text = title + " " + original
-            has_request = "Request" in combined_text or "quest" in combined_text or "equest" in combined_text
-            has_proposal = "Proposal" in combined_text or "oposal" in combined_text
-            has_present = "Present" in combined_text
-            has_developing = "Developing" in combined_text
-            has_business = "Business" in combined_text
-            has_ontario = "Ontario" in combined_text
-            has_digital = "Digital" in combined_text
-            has_library = "Library" in combined_text
-            
-            # If we have basic RFP components, reconstruct the full title
-            if has_request and has_proposal:
+        for pattern, repl in _TITLE_SUBS:
+            title = pattern.sub(repl, title)
+        
+        # Advanced reconstruction for RFP titles ("quest" also covers "Request"/"equest")
+        if "RFP:" in title and "quest" in title:
+            # If we have basic RFP components in either cleaned or original text,
+            # reconstruct the full title ("oposal" also covers "Proposal")
+            if "oposal" in title or "oposal" in original:
                 return "RFP:Request for Proposal To Present a Proposal for Developing the Business Plan for the Ontario Digital Library"
             
             # If we have RFP and Request, at least give partial reconstruction
-            if has_request:
-                return "RFP:Request for Proposal"
+            return "RFP:Request for Proposal"
         
         # Fallback: try to fix common broken patterns
-        title = re.sub(r'Request\s+for\s+o\s*$', 'Request for Proposal', title)
-        title = re.sub(r'RFP:\s*Request\s+for\s+oposal.*', 'RFP:Request for Proposal', title)
-        title = re.sub(r'quest\s+for\s+Proposal.*', 'Request for Proposal', title)
+        for pattern, repl in _TITLE_FALLBACK_SUBS:
+            title = pattern.sub(repl, title)
         
         # If we still have RFP and some recognizable parts, return the full expected title
-        if "RFP:" in title and ("Request" in title or "quest" in title) and "Proposal" in title:
+        if "RFP:" in title and "quest" in title and "Proposal" in title:
             return "RFP:Request for Proposal To Present a Proposal for Developing the Business Plan for the Ontario Digital Library"
         
         # Final cleanup
@@ -526,8 +552,12 @@ def process_pdf_file(input_path: str, output_path: str):
     extractor = PDFOutlineExtractor()
     result = extractor.extract_outline(input_path)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
     
     print(f"Processed: {Path(input_path).name} -> {Path(output_path).name}")
 
@@ -550,9 +580,11 @@ def main():
     
     print(f"Found {len(pdf_files)} PDF files to process")
     
-    for pdf_file in pdf_files:
-        output_file = output_dir / f"{pdf_file.stem}.json"
-        process_pdf_file(str(pdf_file), str(output_file))
+    # Files are independent, process them in parallel
+    input_paths = [str(pdf_file) for pdf_file in pdf_files]
+    output_paths = [str(output_dir / f"{pdf_file.stem}.json") for pdf_file in pdf_files]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_pdf_file, input_paths, output_paths))
     
     print("Processing completed!")
     print(f"Results saved to /app/output")